@@ -1,7 +1,21 @@
-from .version import __version__
+import importlib
 
-from axopy import (features, gui, pipeline, task, design, experiment,
-                   messaging, storage, daq, timing, util)
+from .version import __version__
 
 __all__ = ['features', 'gui', 'pipeline', 'task', 'design', 'experiment',
            'messaging', 'storage', 'daq', 'timing', 'util']
+
+
+def __getattr__(name):
+    # submodules are imported on first access so `import axopy` doesn't pull
+    # in Qt, pyqtgraph, etc. until they're actually needed
+    if name in __all__:
+        module = importlib.import_module('.' + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,6 @@ import numpy
 from PyQt5 import QtCore
 from axopy.messaging import Transmitter
 from axopy.gui.main import get_qtapp, qt_key_map
-from axopy.pipeline import Filter
 
 
 class DaqStream(QtCore.QThread):
@@ -28,6 +27,14 @@ class DaqStream(QtCore.QThread):
     device : daq
         Any object implementing the AxoPy data acquisition interface. See
         :class:`NoiseGenerator` for an example.
+    reads_per_update : int, optional
+        Number of device reads to accumulate before transmitting ``updated``.
+        The chunks are concatenated along their last (sample) axis, so the
+        device must produce NumPy arrays if this is greater than 1. Batching
+        reads reduces the number of cross-thread updates for devices with
+        small read sizes at the cost of latency. Default is 1, meaning every
+        chunk read from the device is transmitted as-is. Changes take effect
+        the next time the stream is started.
 
     Attributes
     ----------
@@ -46,9 +53,10 @@ class DaqStream(QtCore.QThread):
     disconnected = Transmitter()
     finished = Transmitter()
 
-    def __init__(self, device):
+    def __init__(self, device, reads_per_update=1):
         super(DaqStream, self).__init__()
         self.device = device
+        self.reads_per_update = reads_per_update
 
         self._running = False
 
@@ -70,18 +78,32 @@ class DaqStream(QtCore.QThread):
 
         self.device.start()
 
-        while True:
-            if not self._running:
-                break
+        # bind the per-iteration calls once rather than looking them up on
+        # every read
+        read = self.device.read
+        emit = self.updated.emit
+        reads_per_update = self.reads_per_update
 
+        chunks = []
+        while self._running:
             try:
-                d = self.device.read()
+                d = read()
             except IOError:
+                self._running = False
                 self.disconnected.emit()
                 return
 
+            if reads_per_update > 1:
+                chunks.append(d)
+                if len(chunks) < reads_per_update:
+                    continue
+                d = numpy.concatenate(chunks, axis=-1)
+                chunks = []
+
+            # stop() is usually called while the device is blocked in read(),
+            # so check again to avoid transmitting a chunk after stopping
             if self._running:
-                self.updated.emit(d)
+                emit(d)
 
         self.device.stop()
         self.finished.emit()
@@ -134,12 +156,17 @@ class NoiseGenerator(object):
         self.read_size = read_size
 
         self._sigma = amplitude / 3
+        self._rng = numpy.random.default_rng()
 
         self.sleeper = _Sleeper(float(self.read_size/self.rate))
 
     def start(self):
-        """Does nothing for this device. Implemented to follow device API."""
-        pass
+        """Start generating data.
+
+        The first :meth:`read` returns one read period after the device is
+        started.
+        """
+        self.sleeper.start()
 
     def read(self):
         """
@@ -157,9 +184,10 @@ class NoiseGenerator(object):
             The generated data.
         """
         self.sleeper.sleep()
-        data = self._sigma * numpy.random.randn(self.num_channels,
-                                                self.read_size)
-        return data
+        # a new array is generated on each read since the data is usually
+        # handed off to another thread
+        return self._rng.normal(scale=self._sigma,
+                                size=(self.num_channels, self.read_size))
 
     def stop(self):
         """Does nothing for this device. Implemented to follow device API."""
@@ -212,7 +240,8 @@ class Keyboard(QtCore.QObject):
             keys = list('wasd')
         self.keys = keys
 
-        self._qkeys = [qt_key_map[k] for k in keys]
+        # map each watched Qt key to its row in the output
+        self._key_indices = {qt_key_map[k]: i for i, k in enumerate(keys)}
 
         self._sleeper = _Sleeper(1.0/rate)
         self._data = numpy.zeros((len(self.keys), 1))
@@ -221,6 +250,7 @@ class Keyboard(QtCore.QObject):
         """Start the keyboard input device."""
         # install event filter to capture keyboard input events
         get_qtapp().installEventFilter(self)
+        self._sleeper.start()
 
     def read(self):
         """Read which keys have just been pressed.
@@ -233,7 +263,7 @@ class Keyboard(QtCore.QObject):
         """
         self._sleeper.sleep()
         out = self._data.copy()
-        self._data *= 0
+        self._data.fill(0)
         return out
 
     def stop(self):
@@ -250,10 +280,11 @@ class Keyboard(QtCore.QObject):
         self._sleeper.reset()
 
     def eventFilter(self, obj, event):
-        evtype = event.type()
-        if evtype == QtCore.QEvent.KeyPress and event.key() in self._qkeys:
-            self._data[self._qkeys.index(event.key())] = 1
-            return True
+        if event.type() == QtCore.QEvent.KeyPress:
+            index = self._key_indices.get(event.key())
+            if index is not None:
+                self._data[index] = 1
+                return True
 
         return False
 
@@ -287,19 +318,15 @@ class Mouse(QtCore.QObject):
     def __init__(self, rate=10, position=False):
         super(Mouse, self).__init__()
         self.rate = rate
+        self.position = position
         self._sleeper = _Sleeper(1.0/rate)
 
-        if position:
-            b = 1
-        else:
-            b = (1, -1)
-        self._filter = Filter(b)
-
         self.reset()
 
     def start(self):
         """Start sampling mouse movements."""
         get_qtapp().installEventFilter(self)
+        self._sleeper.start()
 
     def read(self):
         """Read the last-updated mouse position.
@@ -310,7 +337,15 @@ class Mouse(QtCore.QObject):
             The mouse "velocity" or position (x, y).
         """
         self._sleeper.sleep()
-        return self._filter.process(self._data.copy())
+        # the event filter replaces the position tuple as a whole, so this
+        # gets a consistent (x, y) pair
+        x, y = self._pos
+        if self.position:
+            return numpy.array([[x], [y]], dtype=float)
+
+        px, py = self._prev
+        self._prev = x, y
+        return numpy.array([[x - px], [y - py]], dtype=float)
 
     def stop(self):
         """Stop sampling mouse movements."""
@@ -318,36 +353,63 @@ class Mouse(QtCore.QObject):
 
     def reset(self):
         """Clear the input device."""
-        self._data = numpy.zeros((2, 1), dtype=float)
-        self._filter.clear()
+        self._pos = 0, 0
+        self._prev = 0, 0
         self._sleeper.reset()
 
     def eventFilter(self, obj, event):
-        evtype = event.type()
-        if evtype == QtCore.QEvent.MouseMove:
-            self._data[0] = event.x()
-            self._data[1] = -event.y()
+        if event.type() == QtCore.QEvent.MouseMove:
+            self._pos = event.x(), -event.y()
         return False
 
 
 class _Sleeper(object):
+    """Paces consecutive reads of a device at a constant period.
+
+    Each call to :meth:`sleep` waits until one period after the previous
+    deadline rather than one period after the previous call returned, so
+    timing errors don't accumulate over many reads. If the caller falls
+    behind, :meth:`sleep` returns immediately and the schedule restarts from
+    the current time instead of trying to catch up.
+
+    The schedule begins at :meth:`start` if it is called, otherwise at the
+    first call to :meth:`sleep`.
+
+    ``time.sleep()`` can overshoot by a sizable fraction of very short
+    periods, so for periods shorter than ``spin_period``, the last
+    ``spin_time`` seconds of each wait are spent polling the clock instead,
+    yielding the GIL between polls.
+    """
+
+    spin_period = 0.005
+    spin_time = 0.0002
 
     def __init__(self, read_time):
         self.read_time = read_time
-        self.last_read_time = None
+        self.next_read_time = None
 
     def sleep(self):
-        t = time.time()
-        if self.last_read_time is None:
-            time.sleep(self.read_time)
+        t = time.monotonic()
+        if self.next_read_time is None:
+            self.next_read_time = t + self.read_time
+
+        delay = self.next_read_time - t
+        if delay > 0:
+            if self.read_time < self.spin_period:
+                if delay > self.spin_time:
+                    time.sleep(delay - self.spin_time)
+                while time.monotonic() < self.next_read_time:
+                    # release the GIL so the GUI thread isn't starved
+                    time.sleep(0)
+            else:
+                time.sleep(delay)
+            self.next_read_time += self.read_time
         else:
-            try:
-                time.sleep(self.read_time - (t - self.last_read_time))
-            except ValueError:
-                # if we're not meeting real-time requirement, don't wait
-                pass
+            # if we're not meeting real-time requirement, don't wait
+            self.next_read_time = t + self.read_time
 
-        self.last_read_time = time.time()
+    def start(self):
+        self.next_read_time = time.monotonic() + self.read_time
 
     def reset(self):
-        self.last_read_time = None
+        self.next_read_time = None
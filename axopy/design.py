@@ -1,11 +1,13 @@
 """Task design containers."""
 
 import numpy
-import random
 import pprint
 
 __all__ = ['Design', 'Block', 'Trial', 'Array']
 
+_rng = numpy.random.default_rng()
+_printer = pprint.PrettyPrinter()
+
 
 class Design(list):
     """Top-level task design container.
@@ -56,7 +58,8 @@ class Block(list):
         Parameters
         ----------
         attrs : dict, optional
-            Dictionary of attribute name/value pairs.
+            Dictionary of attribute name/value pairs. The dictionary is copied,
+            so the same one can be used to initialize several trials.
 
         Returns
         -------
@@ -64,15 +67,32 @@ class Block(list):
             The trial object created. This can be used to add new attributes or
             arrays. See :class:`Trial`.
         """
-        if attrs is None:
-            attrs = {}
-
-        attrs.update({'block': self.index, 'trial': len(self)})
+        attrs = dict(attrs) if attrs else {}
+        attrs['block'] = self.index
+        attrs['trial'] = len(self)
 
         trial = Trial(attrs=attrs)
         self.append(trial)
         return trial
 
+    def as_arrays(self):
+        """Collect the trials' attributes into arrays.
+
+        This is useful for analyzing a block's trials with NumPy (e.g.
+        summarizing times-to-target) rather than looping over trials. Each
+        trial in the block must have the same attributes.
+
+        Returns
+        -------
+        arrays : dict
+            Dictionary mapping each attribute name to an array with one
+            element per trial, in the block's current order.
+        """
+        if not self:
+            return {}
+        return {key: numpy.array([trial.attrs[key] for trial in self])
+                for key in self[0].attrs}
+
     def shuffle(self, reset_index=True, seed=None):
         """Shuffle the block's trials in random order.
 
@@ -83,15 +103,22 @@ class Block(list):
             that they remain in sequential order after shuffling. This is the
             default.
         seed : int, optional
-            If provided, the random seed will be set to the specified value to
-            ensure reproducible shuffling. Note that if you have multiple
+            If provided, the shuffle uses a random number generator seeded
+            with the specified value to ensure reproducible shuffling. The
+            global random state is not affected. Note that if you have multiple
             identical blocks and want to shuffle them differently, use a
             different seed value for each block.
-        """
-        if seed is not None:
-            random.seed(seed)
 
-        random.shuffle(self)
+        Notes
+        -----
+        Shuffling uses NumPy's random number generator rather than Python's
+        :mod:`random` module, so the order produced by a given ``seed`` differs
+        from earlier versions of AxoPy. Seeding :mod:`random` (or NumPy's
+        global random state) has no effect on unseeded shuffles, so passing
+        ``seed`` is the only way to reproduce a shuffle.
+        """
+        rng = _rng if seed is None else numpy.random.default_rng(seed)
+        self[:] = [self[i] for i in rng.permutation(len(self))]
         if reset_index:
             for i, trial in enumerate(self):
                 trial.attrs['trial'] = i
@@ -123,6 +150,8 @@ class Trial(object):
         the array data.
     """
 
+    __slots__ = ('attrs', 'arrays')
+
     def __init__(self, attrs):
         self.attrs = attrs
         self.arrays = {}
@@ -140,7 +169,7 @@ class Trial(object):
         self.arrays[name] = Array(**kwargs)
 
     def __str__(self):
-        return pprint.pformat(self.attrs)
+        return _printer.pformat(self.attrs)
 
 
 class Array(object):
@@ -161,19 +190,58 @@ class Array(object):
         Data to initialize the array with. If ``None``, the first array passed
         to :meth:`stack` is used for initialization.
     stack_axis : int, optional
-        Axis to stack the data along.
+        Axis to stack the data along (0, 1, or 2, as in ``numpy.vstack``,
+        ``numpy.hstack``, and ``numpy.dstack``, respectively).
+    dtype : dtype, optional
+        Data type to hold the data in. Stacked data is cast directly into the
+        array's buffer, so there's no need to convert each segment (e.g. from
+        a device's integer samples to floats) before stacking it. Only
+        ``'same_kind'`` casts are allowed. If ``None``, the data type is
+        promoted as needed to hold everything stacked onto the array.
 
     Attributes
     ----------
     data : ndarray, optional
         The NumPy array holding the data.
+
+    Notes
+    -----
+    Stacked data is copied into a buffer which grows geometrically along the
+    stack axis, so collecting many small segments costs time proportional to
+    the total amount of data rather than quadratic in the number of segments.
+    :attr:`data` is a view of the filled portion of that buffer.
     """
 
-    _stack_funcs = {0: numpy.vstack, 1: numpy.hstack, 2: numpy.dstack}
+    __slots__ = ('stack_axis', 'dtype', '_promote', '_buf', '_axis', '_len')
 
-    def __init__(self, data=None, stack_axis=1):
-        self.data = data
+    # same dimension handling as numpy.vstack, hstack, and dstack
+    _promote_funcs = {0: numpy.atleast_2d,
+                      1: numpy.atleast_1d,
+                      2: numpy.atleast_3d}
+
+    def __init__(self, data=None, stack_axis=1, dtype=None):
+        if stack_axis not in self._promote_funcs:
+            raise ValueError("stack_axis must be 0, 1, or 2.")
         self.stack_axis = stack_axis
+        self.dtype = None if dtype is None else numpy.dtype(dtype)
+        self._promote = self._promote_funcs[stack_axis]
+        self.data = data
+
+    @property
+    def data(self):
+        if self._axis is None:
+            return self._buf
+        return self._buf[self._index(0, self._len)]
+
+    @data.setter
+    def data(self, data):
+        # the data is held as-is until something is stacked onto it
+        if data is not None and self.dtype is not None:
+            data = numpy.asarray(data).astype(
+                self.dtype, casting='same_kind', copy=False)
+        self._buf = data
+        self._axis = None
+        self._len = 0
 
     def stack(self, data):
         """Stack new data onto the array.
@@ -184,10 +252,63 @@ class Array(object):
             New data to add. The direction to stack along is specified in the
             array's constructor (stack_axis).
         """
-        if self.data is None:
-            self.data = data
-        else:
-            self.data = self._stack_funcs[self.stack_axis]([self.data, data])
+        self.extend([data])
+
+    def extend(self, chunks):
+        """Stack a sequence of new data onto the array.
+
+        This is equivalent to calling :meth:`stack` on each chunk in turn, but
+        the buffer is resized at most once for the whole sequence. Use it when
+        several segments of data arrive at once.
+
+        Parameters
+        ----------
+        chunks : iterable of ndarray
+            New data to add, in order.
+        """
+        chunks = list(chunks)
+        if self._buf is None:
+            if not chunks:
+                return
+            self.data = chunks.pop(0)
+        if not chunks:
+            return
+
+        chunks = [self._promote(chunk) for chunk in chunks]
+        if self._axis is None:
+            # treat the initial data as a full buffer so it gets copied into
+            # a growable one below
+            self._buf = self._promote(self._buf)
+            if self.stack_axis == 1 and self._buf.ndim == 1:
+                self._axis = 0
+            else:
+                self._axis = self.stack_axis
+            self._len = self._buf.shape[self._axis]
+
+        end = self._len
+        dtype = self._buf.dtype
+        shape = list(self._buf.shape)
+        for chunk in chunks:
+            shape[self._axis] = chunk.shape[self._axis]
+            if chunk.shape != tuple(shape):
+                raise ValueError(
+                    "Cannot stack data with shape {} onto array with shape "
+                    "{}".format(chunk.shape, self.data.shape))
+            end += chunk.shape[self._axis]
+            if self.dtype is None:
+                dtype = numpy.promote_types(dtype, chunk.dtype)
+            elif not numpy.can_cast(chunk.dtype, dtype, casting='same_kind'):
+                raise TypeError(
+                    "Cannot stack data of type {} onto array of type "
+                    "{}".format(chunk.dtype, dtype))
+
+        if end > self._buf.shape[self._axis] or dtype != self._buf.dtype:
+            self._resize(max(end, 2 * self._buf.shape[self._axis]), dtype)
+
+        for chunk in chunks:
+            stop = self._len + chunk.shape[self._axis]
+            self._buf[self._index(self._len, stop)] = chunk
+            self._len = stop
 
     def clear(self):
         """Clears the buffer.
@@ -195,3 +316,15 @@ class Array(object):
         Anything that was in the buffer is not retrievable.
         """
         self.data = None
+
+    def _index(self, start, stop):
+        index = [slice(None)] * self._buf.ndim
+        index[self._axis] = slice(start, stop)
+        return tuple(index)
+
+    def _resize(self, capacity, dtype):
+        shape = list(self._buf.shape)
+        shape[self._axis] = capacity
+        buf = numpy.empty(shape, dtype=dtype)
+        buf[self._index(0, self._len)] = self.data
+        self._buf = buf
@@ -1,5 +1,7 @@
 """Experiment workflow and design."""
 
+import collections
+
 from axopy import util
 from axopy.storage import Storage
 from axopy.daq import DaqStream
@@ -41,6 +43,9 @@ class Experiment(TransmitterBase):
         self.storage = Storage(data, allow_overwrite=allow_overwrite)
 
         self._receive_keys = False
+        # key presses are forwarded to tasks for every key event, so bind the
+        # signal's emit once
+        self._emit_key = self.key_pressed.emit
 
         self.subject = subject
 
@@ -88,8 +93,8 @@ class Experiment(TransmitterBase):
         self.tasks = tasks
 
         self.current_task = None
-        self.task_iter = iter(self.tasks)
-        self._task_finished()
+        self._task_queue = collections.deque(self.tasks)
+        self._next_task()
 
         self.screen.run()
 
@@ -117,14 +122,16 @@ class Experiment(TransmitterBase):
         self.current_task.run()
 
     def _task_finished(self):
-        if self.current_task is not None:
-            self.current_task.disconnect_all()
-            self.current_task.finished.disconnect(self._task_finished)
-            self.key_pressed.disconnect(self.current_task.key_press)
-
-        try:
-            self.current_task = next(self.task_iter)
-        except StopIteration:
+        self.current_task.disconnect_all()
+        self.current_task.finished.disconnect(self._task_finished)
+        self.key_pressed.disconnect(self.current_task.key_press)
+
+        self._next_task()
+
+    def _next_task(self):
+        if self._task_queue:
+            self.current_task = self._task_queue.popleft()
+        else:
             self.screen.quit()
 
         self.screen.set_container(self.confirm_screen)
@@ -137,7 +144,7 @@ class Experiment(TransmitterBase):
             elif key == util.key_return:
                 self._run_task()
         else:
-            self.key_pressed.emit(key)
+            self._emit_key(key)
 
     def _prepare_daqstream(self):
         if isinstance(self.daq, (list, tuple)):
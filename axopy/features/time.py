@@ -4,10 +4,16 @@
 Notation:
     - :math:`x_i` : value of a signal at time index :math:`i`
     - :math:`N` : length of the signal
+
+Integer input, such as raw samples from an ADC, is converted to floating point
+before computing features so that differences and squares can't overflow.
+Integers of 16 bits or fewer are represented exactly by ``float32``, so they
+are converted to that rather than ``float64``. Floating point input is used
+as-is.
 """
 
 import numpy as np
-from axopy.features.util import (ensure_2d, rolling_window, inverted_t_window,
+from axopy.features.util import (ensure_2d, inverted_t_window,
                                  trapezoidal_window)
 
 
@@ -95,6 +101,7 @@ def mean_absolute_value(x, weights='mav', axis=-1, keepdims=False):
        Reduction and Selection for EMG Signal Classification," Expert Systems
        with Applications, vol. 39, no. 8, pp.  7420-7431, 2012.
     """
+    x = _float_input(x)
     n = x.shape[axis]
 
     if isinstance(weights, np.ndarray):
@@ -103,7 +110,8 @@ def mean_absolute_value(x, weights='mav', axis=-1, keepdims=False):
             raise ValueError("Number of weights in custom window function "
                              "does not match input size.")
     elif weights == 'mav':
-        w = np.ones(n)
+        # unweighted, skip the multiplication
+        return np.mean(np.absolute(x), axis=axis, keepdims=keepdims)
     elif weights == 'mav1':
         w = inverted_t_window(n, p=0.25, a=0.5)
     elif weights == 'mav2':
@@ -116,7 +124,7 @@ def mean_absolute_value(x, weights='mav', axis=-1, keepdims=False):
     # https://stackoverflow.com/a/30032182
     dims = np.ones(x.ndim, dtype=int)
     dims[axis] = -1
-    w = w.reshape(dims)
+    w = w.reshape(dims).astype(x.dtype, copy=False)
 
     return np.mean(w * np.absolute(x), axis=axis, keepdims=keepdims)
 
@@ -152,6 +160,7 @@ def waveform_length(x, axis=-1, keepdims=False):
        Multifunction Myoelectric Control," IEEE Transactions on Biomedical
        Engineering, vol. 40, no. 1, pp. 82-94, 1993.
     """
+    x = _float_input(x)
     return np.sum(np.absolute(np.diff(x, axis=axis)),
                   axis=axis, keepdims=keepdims)
 
@@ -190,7 +199,8 @@ def zero_crossings(x, threshold=0, axis=-1, keepdims=False):
        Multifunction Myoelectric Control," IEEE Transactions on Biomedical
        Engineering, vol. 40, no. 1, pp. 82-94, 1993.
     """
-    # sum to count boolean values which indicate slope sign changes
+    x = _float_input(x)
+    # sum to count boolean values which indicate zero crossings
     return np.sum(
         # two conditions:
         np.logical_and(
@@ -237,19 +247,24 @@ def slope_sign_changes(x, threshold=0, axis=-1, keepdims=False):
        Multifunction Myoelectric Control," IEEE Transactions on Biomedical
        Engineering, vol. 40, no. 1, pp. 82-94, 1993.
     """
-    diffs = np.diff(x, axis=axis)
-    # transpose the diffs so rolling window works
-    adj_diffs = rolling_window(np.swapaxes(np.absolute(diffs), -1, axis), 2)
+    diffs = np.diff(_float_input(x), axis=axis)
+    abs_diffs = np.absolute(diffs)
+
+    # index each diff and the one after it along the time axis
+    first = [slice(None)] * diffs.ndim
+    second = list(first)
+    first[axis] = slice(None, -1)
+    second[axis] = slice(1, None)
+    first, second = tuple(first), tuple(second)
 
     # sum to count boolean values which indicate slope sign changes
     return np.sum(
         # two conditions need to be met
         np.logical_and(
             # 1. sign of the diff changes from one pair of samples to the next
-            np.diff(np.signbit(diffs), axis=axis),
+            np.signbit(diffs[first]) != np.signbit(diffs[second]),
             # 2. the max of two adjacent diffs is bigger than threshold
-            # the transpose here is to un-transpose adj_diffs
-            np.swapaxes(np.max(adj_diffs, axis=-1), -1, axis) > threshold),
+            np.maximum(abs_diffs[first], abs_diffs[second]) > threshold),
         axis=axis, keepdims=keepdims)
 
 
@@ -278,6 +293,7 @@ def root_mean_square(x, axis=-1, keepdims=False):
     y : ndarray, shape (n_channels,)
         RMS of each channel.
     """
+    x = _float_input(x)
     return np.sqrt(np.mean(np.square(x), axis=axis, keepdims=keepdims))
 
 
@@ -303,6 +319,7 @@ def integrated_emg(x, axis=-1, keepdims=False):
     y : ndarray, shape (n_channels,)
         IEMG of each channel.
     """
+    x = _float_input(x)
     return np.sum(np.absolute(x), axis=axis, keepdims=keepdims)
 
 
@@ -347,4 +364,12 @@ def logvar(x, axis=-1, keepdims=False):
        Control," IEEE Transactions on Neural Systems and Rehabilitation
        Engineering, vol. 22, no. 2, pp. 269–279, 2014.
     """
+    x = _float_input(x)
     return np.log10(np.var(x, axis=axis, keepdims=keepdims))
+
+
+def _float_input(x):
+    x = np.asarray(x)
+    if x.dtype.kind in 'biu':
+        return x.astype(np.float32 if x.dtype.itemsize <= 2 else np.float64)
+    return x
@@ -23,18 +23,26 @@ def ensure_2d(array):
     return array
 
 
-def rolling_window(array, n):
+def rolling_window(array, n, step=1):
     """Create a rolling window from an array.
 
     An extra axis is added to efficiently compute statistics over. Use
     ``axis=-1`` to remove the extra axis.
 
+    The windows are a view of the input array, so no data is copied. This
+    makes it possible to compute features over all windows of a long recording
+    at once rather than looping over the windows, since the features in
+    :mod:`axopy.features.time` accept arrays with any number of dimensions.
+
     Parameters
     ----------
     array : ndarray
         The input array.
     n : int
         Window length.
+    step : int, optional
+        Number of samples between the starts of consecutive windows. Must be
+        at least 1. By default, a window starts at every sample.
 
     Returns
     -------
@@ -55,6 +63,9 @@ def rolling_window(array, n):
     array([[1, 2, 3],
            [2, 3, 4],
            [3, 4, 5]])
+    >>> rolling_window(x, 3, step=2)
+    array([[1, 2, 3],
+           [3, 4, 5]])
     >>> x = np.array([[1, 2, 3, 4], [5, 6, 7, 8]])
     >>> rolling_window(x, 2)
     array([[[1, 2],
@@ -69,8 +80,12 @@ def rolling_window(array, n):
     ----------
     .. [1] https://mail.scipy.org/pipermail/numpy-discussion/2010-December/054392.html # noqa
     """
-    shape = array.shape[:-1] + (array.shape[-1] - n + 1, n)
-    strides = array.strides + (array.strides[-1],)
+    if step < 1:
+        raise ValueError("step must be a positive integer.")
+
+    shape = array.shape[:-1] + ((array.shape[-1] - n) // step + 1, n)
+    stride = array.strides[-1]
+    strides = array.strides[:-1] + (step * stride, stride)
     return np.lib.stride_tricks.as_strided(array,
                                            shape=shape,
                                            strides=strides)
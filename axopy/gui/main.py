@@ -192,9 +192,8 @@ class _MainWindow(QtWidgets.QMainWindow):
         directly and it doesn't need to be overriden. Connect to the
         ``key_pressed`` transmitter to handle key press events.
         """
-        try:
-            key = key_map[event.key()]
-        except KeyError:
+        key = key_map.get(event.key())
+        if key is None:
             return super().keyPressEvent(event)
 
         self.key_pressed.emit(key)
@@ -217,9 +216,9 @@ class Container(QtWidgets.QWidget):
             the container.
         axopy.gui.graph: Plotting widgets that can be added to the container.
         """
-        self.layout = QtWidgets.QGridLayout()
+        self.layout = QtWidgets.QVBoxLayout()
         self.setLayout(self.layout)
-        self.layout.addWidget(widget, 0, 0)
+        self.layout.addWidget(widget)
 
     def set_layout(self, layout):
         """Set the layout of the container.
@@ -266,18 +265,16 @@ class _SessionConfig(QtWidgets.QDialog):
         for label, typ in options.items():
             if typ in {str, int, float}:
                 w = QtWidgets.QLineEdit()
-                self.widgets[label] = w
-                form_layout.addRow(label, w)
             elif isinstance(typ, collections.abc.Sequence):
                 w = QtWidgets.QComboBox()
-                for choice in typ:
-                    w.addItem(str(choice))
-                self.widgets[label] = w
-                form_layout.addRow(label, w)
+                w.addItems([str(choice) for choice in typ])
             else:
                 raise TypeError("option {}({}) not a supported type".format(
                     label, typ))
 
+            self.widgets[label] = w
+            form_layout.addRow(label, w)
+
         button = QtWidgets.QPushButton("Ok")
         main_layout.addWidget(button)
         button.clicked.connect(self._on_button_click)
@@ -292,13 +289,13 @@ class _SessionConfig(QtWidgets.QDialog):
         for label, widget in self.widgets.items():
             t = self.options[label]
             if t is str:
-                self.results[label] = str(widget.text())
+                self.results[label] = widget.text()
             elif t is int:
                 self.results[label] = int(widget.text())
             elif t is float:
                 self.results[label] = float(widget.text())
             else:
-                self.results[label] = str(widget.currentText())
+                self.results[label] = widget.currentText()
 
         if 'subject' in self.options and self.results['subject'] == '':
             QtWidgets.QMessageBox.warning(
@@ -7,9 +7,7 @@ for information on these use cases/api.jpeg/api.jpeg/api.jpeg.
 """
 
 import os
-import h5py
 import numpy
-import pandas
 import zipfile
 import shutil
 import pickle
@@ -131,12 +129,14 @@ class Storage(object):
         reader : TaskReader
             A new TaskReader for working with the existing task data.
         """
-        if task_id not in self.task_ids:
+        path = None
+        if self.subject_id is not None and _is_entry_name(task_id):
+            path = self._task_path(task_id)
+        if path is None or not os.path.isdir(path):
             raise ValueError(
                 "Subject {} has not started \"{}\" yet. Use `create_task` to "
                 "create it first.".format(self.subject_id, task_id))
 
-        path = self._task_path(task_id)
         return TaskReader(path)
 
     def to_zip(self, outfile):
@@ -240,6 +240,7 @@ class TaskReader(object):
     def trials(self):
         """A Pandas DataFrame representing the trial data."""
         if self._trials is None:
+            import pandas
             self._trials = pandas.read_csv(_trials_path(self.root))
         return self._trials
 
@@ -257,7 +258,8 @@ class TaskReader(object):
 
     def array(self, name):
         """Retrieve an array type's data for all trials."""
-        return numpy.vstack(self.iterarray(name))
+        return numpy.concatenate(
+            [numpy.atleast_2d(a) for a in self.iterarray(name)], axis=0)
 
     def pickle(self, name):
         """Load a pickled object from storage.
@@ -309,6 +311,7 @@ class TrialWriter(object):
                 self.data[col] = []
             self.data[col].append(val)
 
+        import pandas
         self.df = pandas.DataFrame(self.data)
         self.df.to_csv(self.filepath, index=False)
 
@@ -329,6 +332,11 @@ def _pickle_path(taskroot, picklename):
     return os.path.join(taskroot, '{}.pkl'.format(picklename))
 
 
+def _is_entry_name(name):
+    # a single directory entry rather than a path or a relative reference
+    return name not in ('', '.', '..') and os.path.basename(name) == name
+
+
 def read_hdf5(filepath, dataset='data'):
     """Read the contents of a dataset.
 
@@ -349,6 +357,7 @@ def read_hdf5(filepath, dataset='data'):
         The data (read into memory) as a NumPy array. The dtype, shape, etc. is
         all determined by whatever is in the file.
     """
+    import h5py
     with h5py.File(filepath, 'r') as f:
         return f.get('/{}'.format(dataset))[:]
 
@@ -371,6 +380,7 @@ def write_hdf5(filepath, data, dataset='data'):
     dataset : str, optional
         Name of the dataset to create. Default is 'data'.
     """
+    import h5py
     with h5py.File(filepath, 'a') as f:
         f.create_dataset(dataset, data=data)
 
@@ -3,7 +3,23 @@
 See the :ref:`user guide <task>` for information on implementing tasks.
 """
 
+import importlib
+
 from axopy.task.base import Task
-from axopy.task.common import Oscilloscope
 
 __all__ = ['Task', 'Oscilloscope']
+
+# generic tasks are imported on first access since they pull in plotting
+# libraries that tasks subclassing Task don't necessarily need
+_lazy_tasks = {
+    'Oscilloscope': 'axopy.task.common',
+}
+
+
+def __getattr__(name):
+    if name in _lazy_tasks:
+        value = getattr(importlib.import_module(_lazy_tasks[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
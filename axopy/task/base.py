@@ -61,12 +61,10 @@ class Task(TransmitterBase):
     def disconnect(self, transmitter, receiver):
         """Disconnect a transmitter from a receiver."""
         name = _connection_name(transmitter, receiver)
-        try:
-            del self._connections[name]
-            transmitter.disconnect(receiver)
-        except KeyError:
+        if self._connections.pop(name, None) is None:
             # tx/rx pair already removed/disconnected
-            pass
+            return
+        transmitter.disconnect(receiver)
 
     def disconnect_all(self):
         """Disconnect all of the task's manually-created connections."""
@@ -64,13 +64,15 @@ def emgsim():
 
     samp_per_input = int(fs / update_rate)
 
+    rng = np.random.default_rng()
+
     pipeline = Pipeline([
         # get keyboard inputs of past second
         Windower(update_rate),
         # take mean over last second and apply a gain
         Callable(lambda x: np.mean(x, axis=1, keepdims=True)),
         # generate noise with amplitude of previous output
-        Callable(lambda x, k: gain * x * np.random.randn(x.shape[0], k),
+        Callable(lambda x, k: gain * x * rng.standard_normal((x.shape[0], k)),
                  func_args=(samp_per_input,)),
         # window for pretty display in oscilloscope
         Windower(osc_view_time * update_rate * samp_per_input),
@@ -0,0 +1,136 @@
+import time
+from PyQt5 import QtCore, QtGui
+from axopy.daq import (NoiseGenerator, DaqStream, Keyboard, Mouse,
+                       _Sleeper)
+
+
+def test_daqstream(qtbot):
+    dev = NoiseGenerator(rate=1000, num_channels=2, read_size=10)
+    stream = DaqStream(dev)
+
+    with qtbot.waitSignal(stream.updated, timeout=1000) as blocker:
+        stream.start()
+    stream.stop()
+
+    assert blocker.args[0].shape == (2, 10)
+
+
+def test_daqstream_reads_per_update(qtbot):
+    dev = NoiseGenerator(rate=1000, num_channels=2, read_size=10)
+    stream = DaqStream(dev, reads_per_update=3)
+
+    with qtbot.waitSignal(stream.updated, timeout=1000) as blocker:
+        stream.start()
+    stream.stop()
+
+    assert blocker.args[0].shape == (2, 30)
+
+
+class _FailingDevice(object):
+
+    def start(self):
+        pass
+
+    def read(self):
+        raise IOError
+
+    def stop(self):
+        pass
+
+
+def test_daqstream_disconnected(qtbot):
+    stream = DaqStream(_FailingDevice())
+
+    with qtbot.waitSignal(stream.disconnected, timeout=1000):
+        stream.start()
+    stream.wait()
+
+    assert not stream.running
+
+
+def test_noise_generator():
+    dev = NoiseGenerator(rate=10000, num_channels=3, read_size=5)
+    dev.start()
+    d1 = dev.read()
+    d2 = dev.read()
+    dev.stop()
+
+    assert d1.shape == (3, 5)
+    # each read produces a new array
+    assert d1 is not d2
+
+
+def test_sleeper():
+    sleeper = _Sleeper(0.01)
+
+    start = time.monotonic()
+    for i in range(5):
+        sleeper.sleep()
+    assert time.monotonic() - start >= 0.05
+
+    # falling behind doesn't cause subsequent calls to rush to catch up
+    time.sleep(0.03)
+    sleeper.sleep()
+    start = time.monotonic()
+    sleeper.sleep()
+    assert time.monotonic() - start >= 0.009
+
+
+def test_keyboard(qtbot):
+    dev = Keyboard(rate=1000, keys=['a', 'd'])
+
+    def press(key):
+        event = QtGui.QKeyEvent(QtCore.QEvent.KeyPress, key,
+                                QtCore.Qt.NoModifier)
+        return dev.eventFilter(None, event)
+
+    assert press(QtCore.Qt.Key_D)
+    # keys not watched are passed along
+    assert not press(QtCore.Qt.Key_B)
+
+    assert dev.read().tolist() == [[0], [1]]
+    assert dev.read().tolist() == [[0], [0]]
+
+
+def _move_mouse(dev, x, y):
+    event = QtGui.QMouseEvent(QtCore.QEvent.MouseMove, QtCore.QPointF(x, y),
+                              QtCore.Qt.NoButton, QtCore.Qt.NoButton,
+                              QtCore.Qt.NoModifier)
+    # mouse events are never consumed
+    assert not dev.eventFilter(None, event)
+
+
+def test_mouse(qtbot):
+    dev = Mouse(rate=1000)
+
+    _move_mouse(dev, 3, 4)
+    assert dev.read().tolist() == [[3], [-4]]
+    _move_mouse(dev, 5, 1)
+    assert dev.read().tolist() == [[2], [3]]
+    assert dev.read().tolist() == [[0], [0]]
+
+
+def test_mouse_position(qtbot):
+    dev = Mouse(rate=1000, position=True)
+
+    _move_mouse(dev, 3, 4)
+    assert dev.read().tolist() == [[3], [-4]]
+    assert dev.read().tolist() == [[3], [-4]]
+
+
+def test_sleeper_start():
+    sleeper = _Sleeper(0.02)
+    sleeper.start()
+
+    # the first deadline is set from the start time rather than the first
+    # sleep, so time spent before sleeping counts toward the first period
+    assert sleeper.next_read_time - time.monotonic() <= sleeper.read_time
+
+
+def test_sleeper_short_period():
+    sleeper = _Sleeper(0.001)
+
+    start = time.monotonic()
+    for i in range(20):
+        sleeper.sleep()
+    assert time.monotonic() - start >= 0.02
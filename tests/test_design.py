@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 from axopy import design
 
@@ -27,6 +28,30 @@ def test_design():
     t.add_array('static', data=np.random.randn(100))
 
 
+def test_add_trial_copies_attrs():
+    b = design.Design().add_block()
+    attrs = {'label': 'a'}
+    t0 = b.add_trial(attrs=attrs)
+    t1 = b.add_trial(attrs=attrs)
+    assert attrs == {'label': 'a'}
+    assert t0.attrs['trial'] == 0
+    assert t1.attrs['trial'] == 1
+
+
+def test_block_as_arrays():
+    b = design.Design().add_block()
+    assert b.as_arrays() == {}
+
+    for i in range(4):
+        b.add_trial(attrs={'label': 'ab'[i % 2], 'time': 0.5 * i})
+
+    arrays = b.as_arrays()
+    assert set(arrays) == {'block', 'trial', 'label', 'time'}
+    np.testing.assert_array_equal(arrays['trial'], np.arange(4))
+    np.testing.assert_array_equal(arrays['time'], [0, 0.5, 1, 1.5])
+    assert list(arrays['label']) == ['a', 'b', 'a', 'b']
+
+
 def test_block_shuffle():
     d = design.Design()
     b = d.add_block()
@@ -51,3 +76,57 @@ def test_block_shuffle_seed():
 
     for j in range(10):
         assert d[0][j].attrs['trial'] == d[1][j].attrs['trial']
+
+
+def test_array_stack():
+    a = design.Array()
+    chunks = [np.random.randn(2, n) for n in (1, 3, 2, 7, 1, 5)]
+    for chunk in chunks:
+        a.stack(chunk)
+    np.testing.assert_array_equal(a.data, np.hstack(chunks))
+
+    # single rows are promoted to 2D when stacking vertically
+    a = design.Array(stack_axis=0)
+    for i in range(5):
+        a.stack(np.arange(3) + i)
+    assert a.data.shape == (5, 3)
+    assert a.data[-1, 0] == 4
+
+    # dtype is promoted as with numpy concatenation
+    a = design.Array(data=np.zeros((2, 3), dtype=int))
+    a.stack(np.ones((2, 2)))
+    assert a.data.dtype == np.float64
+    assert a.data.shape == (2, 5)
+
+    with pytest.raises(ValueError):
+        a.stack(np.ones((3, 2)))
+
+    a.clear()
+    assert a.data is None
+
+    with pytest.raises(ValueError):
+        design.Array(stack_axis=3)
+
+
+def test_array_dtype():
+    a = design.Array(dtype=np.float32)
+    a.stack(np.ones((2, 3), dtype=np.int16))
+    assert a.data.dtype == np.float32
+    a.extend([np.ones((2, 2), dtype=np.int16), np.ones((2, 1))])
+    assert a.data.dtype == np.float32
+    assert a.data.shape == (2, 6)
+
+    with pytest.raises(TypeError):
+        a.stack(np.ones((2, 1), dtype=complex))
+
+
+def test_array_extend():
+    chunks = [np.random.randn(3, n) for n in (4, 1, 6)]
+
+    a = design.Array()
+    a.extend(chunks)
+    np.testing.assert_array_equal(a.data, np.hstack(chunks))
+
+    a.extend(chunks[:1])
+    a.extend([])
+    np.testing.assert_array_equal(a.data, np.hstack(chunks + chunks[:1]))
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_array_almost_equal
 import axopy.features as features
 
 
@@ -38,6 +38,24 @@ def test_rolling_window_2d(array_2d):
     assert_equal(features.util.rolling_window(array_2d, 2), out)
 
 
+def test_rolling_window_step(array_2d):
+    out = np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]])
+    assert_equal(features.util.rolling_window(array_2d, 2, step=2), out)
+
+    with pytest.raises(ValueError):
+        features.util.rolling_window(array_2d, 2, step=0)
+
+
+def test_rolling_window_batch_features():
+    x = np.random.randn(3, 100)
+    windows = features.util.rolling_window(x, 20, step=10)
+    batch = features.waveform_length(windows)
+    assert batch.shape == (3, 9)
+    for i in range(9):
+        assert_array_almost_equal(
+            batch[:, i], features.waveform_length(x[:, 10*i:10*i+20]))
+
+
 def test_inverted_t_window():
     # default params (n = 8)
     truth = np.array([0.5, 1, 1, 1, 1, 1, 0.5, 0.5])
@@ -184,3 +202,13 @@ def test_integrated_emg():
 def test_logvar():
     features.logvar(np.random.randn(100))
     features.logvar(np.random.randn(2, 100))
+
+
+def test_int16_input():
+    # differences and squares of raw ADC samples shouldn't overflow
+    x = np.array([[-32768, 32767, -32768]], dtype=np.int16)
+    assert_equal(features.waveform_length(x), [131070])
+    assert_equal(features.zero_crossings(x, threshold=1), [2])
+    assert_array_almost_equal(features.mean_absolute_value(x),
+                              [(32768 * 2 + 32767) / 3], decimal=2)
+    assert features.root_mean_square(x).dtype == np.float32
@@ -50,6 +50,8 @@ def test_main_window(qtbot):
     win.key_pressed.connect(on_key_press)
 
     qtbot.keyClicks(c, 'a')
+    # keys without an axopy name aren't transmitted
+    qtbot.keyClicks(c, '+')
 
 
 def test_container_widget():
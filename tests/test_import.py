@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+import axopy
+
+
+def test_import_without_qt():
+    # run in a fresh interpreter since other tests have already loaded Qt
+    code = ("import sys, axopy, axopy.design; "
+            "assert 'PyQt5' not in sys.modules, 'PyQt5 imported'")
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_dir_no_duplicates():
+    axopy.design
+    names = dir(axopy)
+    assert names.count('design') == 1
+    assert set(axopy.__all__) <= set(names)
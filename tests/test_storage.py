@@ -47,6 +47,22 @@ def test_storage(tmpdirpath):
     assert reader.pickle('somelist') == [1, 2, 3]
 
 
+def test_task_reader_array(tmpdirpath):
+    storage = Storage(root=tmpdirpath)
+    storage.subject_id = 'p0'
+
+    writer = storage.create_task('arrays')
+    block = Design().add_block()
+    for i in range(3):
+        t = block.add_trial()
+        t.add_array('data', data=numpy.full(4, i))
+        writer.write(t)
+
+    data = storage.require_task('arrays').array('data')
+    assert data.shape == (3, 4)
+    assert data[2, 0] == 2
+
+
 def test_allow_overwrite(tmpdirpath):
     root = os.path.join(tmpdirpath, 'overwrite')
 
@@ -117,6 +133,10 @@ def test_storage_directories(tmpdir_factory):
     # fail if you require a non-existing task
     with pytest.raises(ValueError):
         storage.require_task('task2')
+    # fail for IDs that aren't a single task directory
+    for task_id in ['', '.', '..', 'task1/']:
+        with pytest.raises(ValueError):
+            storage.require_task(task_id)
 
 
 def test_hdf5_read_write(tmpdirpath):